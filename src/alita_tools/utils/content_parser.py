@@ -7,7 +7,6 @@ from pptx.enum.shapes import MSO_SHAPE_TYPE
 import io
 import pymupdf
 from langchain_core.tools import ToolException
-from transformers import BlipProcessor, BlipForConditionalGeneration
 
 def parse_file_content(file_name, file_content, is_capture_image: bool = False, page_number: int = None):
     if file_name.endswith('.txt'):
@@ -98,6 +97,9 @@ def read_pptx_slide(slide, index, is_capture_image):
     return text_content
 
 def describe_image(image):
+    # transformers pulls in torch, import it only when an image actually has to be described
+    from transformers import BlipProcessor, BlipForConditionalGeneration
+
     processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
     model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-base")
     inputs = processor(image, return_tensors="pt")
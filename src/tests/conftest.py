@@ -11,6 +11,11 @@ ALLURE_RESULTS_DIR = Path("allure-results")
 ALLURE_REPORT_DIR = Path("docs")
 
 
+def _is_xdist_worker() -> bool:
+    """Return True inside a pytest-xdist worker; the controller owns allure-results."""
+    return "PYTEST_XDIST_WORKER" in os.environ
+
+
 @pytest.fixture(scope="session")
 def check_env_vars(env_vars):
     """Ensure all required environment variables are set."""
@@ -25,16 +30,10 @@ def pytest_configure(config):
     if str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
     
-    # Create results directory without removing existing files
-    ALLURE_RESULTS_DIR.mkdir(exist_ok=True)
-    
-    config.option.allure_report_dir = str(ALLURE_RESULTS_DIR)
-
-
-@pytest.fixture(scope="session", autouse=True)
-def test_suite_cleanup():
-    # Clean up allure results before test session starts
-    if ALLURE_RESULTS_DIR.exists():
+    # Clean up allure results before any test runs. pytest replays this hook for conftests
+    # found during collection (e.g. `pytest -m unit` from the repo root), unlike sessionstart.
+    # xdist workers share the directory and must not wipe each other's results
+    if not _is_xdist_worker() and ALLURE_RESULTS_DIR.exists():
         for file in ALLURE_RESULTS_DIR.glob("*"):
             try:
                 if file.is_file():
@@ -43,16 +42,15 @@ def test_suite_cleanup():
                     shutil.rmtree(file)
             except Exception:
                 pass
-    else:
-        ALLURE_RESULTS_DIR.mkdir(exist_ok=True)
+    ALLURE_RESULTS_DIR.mkdir(exist_ok=True)
     
-    yield
+    config.option.allure_report_dir = str(ALLURE_RESULTS_DIR)
 
 
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
     print(f"\nTest suite finished.\nExit status: {exitstatus}")
-    if not os.environ.get("GITHUB_ACTIONS"):
+    if not os.environ.get("GITHUB_ACTIONS") and not _is_xdist_worker():
         generate_allure_report()
 
 
@@ -91,6 +89,8 @@ def generate_allure_report() -> None:
 def pytest_unconfigure(config):
     yield
     # Clean up allure results after all hooks have completed
+    if _is_xdist_worker():
+        return
     if ALLURE_RESULTS_DIR.exists() and not os.environ.get("PRESERVE_ALLURE_RESULTS"):
         try:
             shutil.rmtree(ALLURE_RESULTS_DIR)
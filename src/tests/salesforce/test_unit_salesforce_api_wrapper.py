@@ -1,5 +1,5 @@
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import requests
@@ -7,6 +7,15 @@ from langchain_core.tools import ToolException
 from pydantic import SecretStr
 
 from alita_tools.salesforce.api_wrapper import SalesforceApiWrapper
+from alita_tools.salesforce.model import (
+    SalesforceCreateCase,
+    SalesforceCreateLead,
+    SalesforceInput,
+    SalesforceSearch,
+    SalesforceUpdateCase,
+    SalesforceUpdateLead,
+)
+from ..utils import FakeResponse
 
 
 @pytest.mark.unit
@@ -47,14 +56,16 @@ class TestSalesforceApiWrapper:
         salesforce_api_wrapper.authenticate()
 
         # Check the call arguments, ensuring client_secret is accessed correctly
-        mock_requests.post.assert_called_once()
-        call_args, call_kwargs = mock_requests.post.call_args
-        assert call_args[0] == f"{salesforce_api_wrapper.base_url}/services/oauth2/token"
-        assert call_kwargs['data'] == {
-            "grant_type": "client_credentials",
-            "client_id": salesforce_api_wrapper.client_id,
-            "client_secret": salesforce_api_wrapper.client_secret.get_secret_value(),
-        }
+        expected_call = call(
+            f"{salesforce_api_wrapper.base_url}/services/oauth2/token",
+            data={
+                "grant_type": "client_credentials",
+                "client_id": salesforce_api_wrapper.client_id,
+                "client_secret": salesforce_api_wrapper.client_secret.get_secret_value(),
+            },
+        )
+        assert mock_requests.post.call_count == 1
+        assert mock_requests.post.call_args == expected_call
         mock_response.raise_for_status.assert_called_once()
         assert salesforce_api_wrapper._access_token == "fake_token"
 
@@ -103,9 +114,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_create_case_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful case creation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "case123", "success": True, "errors": []}
+        mock_response = FakeResponse(201, {"id": "case123", "success": True, "errors": []})
         mock_requests.post.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token" # Assume authenticated
 
@@ -115,19 +124,15 @@ class TestSalesforceApiWrapper:
         expected_payload = {
             "Subject": "Test Subject", "Description": "Test Desc", "Origin": "Web", "Status": "New"
         }
-        mock_requests.post.assert_called_once()
-        call_args, call_kwargs = mock_requests.post.call_args
-        assert call_args[0] == expected_url
-        assert call_kwargs['json'] == expected_payload
-        assert call_kwargs['headers'] == salesforce_api_wrapper._headers()
+        expected_call = call(expected_url, json=expected_payload, headers=salesforce_api_wrapper._headers())
+        assert mock_requests.post.call_count == 1
+        assert mock_requests.post.call_args == expected_call
         assert result == {"id": "case123", "success": True, "errors": []}
 
     @pytest.mark.negative
     def test_create_case_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed case creation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Required field missing", "errorCode": "MISSING_FIELD"}]
+        mock_response = FakeResponse(400, [{"message": "Required field missing", "errorCode": "MISSING_FIELD"}])
         mock_requests.post.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -141,9 +146,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_create_lead_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful lead creation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "lead123", "success": True, "errors": []}
+        mock_response = FakeResponse(201, {"id": "lead123", "success": True, "errors": []})
         mock_requests.post.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -153,19 +156,15 @@ class TestSalesforceApiWrapper:
         expected_payload = {
             "LastName": "Smith", "Company": "Acme Corp", "Email": "smith@acme.com", "Phone": "1234567890"
         }
-        mock_requests.post.assert_called_once()
-        call_args, call_kwargs = mock_requests.post.call_args
-        assert call_args[0] == expected_url
-        assert call_kwargs['json'] == expected_payload
-        assert call_kwargs['headers'] == salesforce_api_wrapper._headers()
+        expected_call = call(expected_url, json=expected_payload, headers=salesforce_api_wrapper._headers())
+        assert mock_requests.post.call_count == 1
+        assert mock_requests.post.call_args == expected_call
         assert result == {"id": "lead123", "success": True, "errors": []}
 
     @pytest.mark.negative
     def test_create_lead_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed lead creation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Invalid email format", "errorCode": "INVALID_EMAIL_ADDRESS"}]
+        mock_response = FakeResponse(400, [{"message": "Invalid email format", "errorCode": "INVALID_EMAIL_ADDRESS"}])
         mock_requests.post.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -180,9 +179,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_search_salesforce_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful SOQL search."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"totalSize": 1, "done": True, "records": [{"attributes": {"type": "Case"}, "Id": "case123"}]}
+        mock_response = FakeResponse(200, {"totalSize": 1, "done": True, "records": [{"attributes": {"type": "Case"}, "Id": "case123"}]})
         mock_requests.get.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
         query = "SELECT Id FROM Case WHERE Subject='Test'"
@@ -199,9 +196,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.negative
     def test_search_salesforce_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed SOQL search."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Invalid query", "errorCode": "INVALID_QUERY"}]
+        mock_response = FakeResponse(400, [{"message": "Invalid query", "errorCode": "INVALID_QUERY"}])
         mock_requests.get.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
         query = "SELECT InvalidField FROM Case"
@@ -217,9 +212,7 @@ class TestSalesforceApiWrapper:
     def test_search_salesforce_no_json_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed SOQL search with non-JSON response."""
         # Simulate non-JSON response for an error status code
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.json.side_effect = json.decoder.JSONDecodeError("msg", "doc", 0)
+        mock_response = FakeResponse(500, json.decoder.JSONDecodeError("msg", "doc", 0))
         mock_requests.get.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
         query = "SELECT Id FROM Case"
@@ -235,8 +228,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_update_case_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful case update (204 No Content)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
+        mock_response = FakeResponse(204)
         # No .json() method called for 204
         mock_requests.patch.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
@@ -255,9 +247,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.negative
     def test_update_case_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed case update."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = [{"message": "Case not found", "errorCode": "NOT_FOUND"}]
+        mock_response = FakeResponse(404, [{"message": "Case not found", "errorCode": "NOT_FOUND"}])
         mock_requests.patch.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -270,8 +260,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_update_lead_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful lead update (204 No Content)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
+        mock_response = FakeResponse(204)
         mock_requests.patch.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -289,9 +278,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.negative
     def test_update_lead_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed lead update."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Invalid phone number", "errorCode": "INVALID_PHONE"}]
+        mock_response = FakeResponse(400, [{"message": "Invalid phone number", "errorCode": "INVALID_PHONE"}])
         mock_requests.patch.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -306,9 +293,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_execute_generic_rq_get_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful generic GET request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"records": [{"Id": "1"}]}
+        mock_response = FakeResponse(200, {"records": [{"Id": "1"}]})
         mock_requests.request.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
 
@@ -328,9 +313,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_execute_generic_rq_post_success(self, salesforce_api_wrapper, mock_requests):
         """Test successful generic POST request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "new_record_id", "success": True}
+        mock_response = FakeResponse(201, {"id": "new_record_id", "success": True})
         mock_requests.request.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
         params_json = '{"Name": "New Account"}'
@@ -351,8 +334,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_execute_generic_rq_patch_success_204(self, salesforce_api_wrapper, mock_requests):
         """Test successful generic PATCH request with 204 No Content."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
+        mock_response = FakeResponse(204)
         # No .json() for 204
         mock_requests.request.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
@@ -373,9 +355,7 @@ class TestSalesforceApiWrapper:
     @pytest.mark.negative
     def test_execute_generic_rq_failure(self, salesforce_api_wrapper, mock_requests):
         """Test failed generic request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Generic error", "errorCode": "GENERIC_ERROR"}]
+        mock_response = FakeResponse(400, [{"message": "Generic error", "errorCode": "GENERIC_ERROR"}])
         mock_requests.request.return_value = mock_response
         salesforce_api_wrapper._access_token = "fake_token"
         relative_url = "/sobjects/InvalidObject/"
@@ -395,39 +375,31 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_parse_salesforce_error_list(self, salesforce_api_wrapper):
         """Test parsing error response which is a list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [
+        mock_response = FakeResponse(400, [
             {"message": "Error 1", "errorCode": "CODE1"},
             {"message": "Error 2", "errorCode": "CODE2"}
-        ]
+        ])
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error == "Error 1; Error 2"
 
     @pytest.mark.positive
     def test_parse_salesforce_error_dict(self, salesforce_api_wrapper):
         """Test parsing error response which is a dictionary."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"message": "Not Found", "errorCode": "NOT_FOUND"}
+        mock_response = FakeResponse(404, {"message": "Not Found", "errorCode": "NOT_FOUND"})
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error == "Not Found"
 
     @pytest.mark.positive
     def test_parse_salesforce_error_duplicates(self, salesforce_api_wrapper):
         """Test parsing duplicate error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = [{"message": "Duplicates detected", "errorCode": "DUPLICATES_DETECTED"}]
+        mock_response = FakeResponse(400, [{"message": "Duplicates detected", "errorCode": "DUPLICATES_DETECTED"}])
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error == "Duplicate detected: Salesforce found similar records. Consider updating an existing record."
 
     @pytest.mark.positive
     def test_parse_salesforce_error_no_json(self, salesforce_api_wrapper):
         """Test parsing error response with no JSON body."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.json.side_effect = requests.exceptions.JSONDecodeError("msg", "doc", 0)
+        mock_response = FakeResponse(500, requests.exceptions.JSONDecodeError("msg", "doc", 0))
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error == "No JSON response from Salesforce. HTTP Status: 500"
 
@@ -436,26 +408,22 @@ class TestSalesforceApiWrapper:
     @pytest.mark.positive
     def test_parse_salesforce_error_success_200(self, salesforce_api_wrapper):
         """Test parsing a successful 200 response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"records": [], "totalSize": 0, "done": True} # Example success response with standard fields
+        # Example success response with standard fields
+        mock_response = FakeResponse(200, {"records": [], "totalSize": 0, "done": True})
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error is None
 
     @pytest.mark.positive
     def test_parse_salesforce_error_success_201(self, salesforce_api_wrapper):
         """Test parsing a successful 201 response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "newId", "success": True}
+        mock_response = FakeResponse(201, {"id": "newId", "success": True})
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error is None
 
     @pytest.mark.positive
     def test_parse_salesforce_error_success_204(self, salesforce_api_wrapper):
         """Test parsing a successful 204 response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
+        mock_response = FakeResponse(204)
         # No json() call expected for 204
         error = salesforce_api_wrapper._parse_salesforce_error(mock_response)
         assert error is None
@@ -465,15 +433,16 @@ class TestSalesforceApiWrapper:
         """Test the structure of get_available_tools."""
         tools = salesforce_api_wrapper.get_available_tools()
         assert isinstance(tools, list)
-        assert len(tools) == 6 # Should match the number of defined tools
-
-        expected_names = {"create_case", "create_lead", "search_salesforce", "update_case", "update_lead", "execute_generic_rq"}
-        actual_names = {tool["name"] for tool in tools}
-        assert actual_names == expected_names
-
-        for tool in tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "args_schema" in tool
-            assert "ref" in tool
-            assert callable(tool["ref"])
+
+        expected = {
+            ("create_case", SalesforceCreateCase, salesforce_api_wrapper.create_case),
+            ("create_lead", SalesforceCreateLead, salesforce_api_wrapper.create_lead),
+            ("search_salesforce", SalesforceSearch, salesforce_api_wrapper.search_salesforce),
+            ("update_case", SalesforceUpdateCase, salesforce_api_wrapper.update_case),
+            ("update_lead", SalesforceUpdateLead, salesforce_api_wrapper.update_lead),
+            ("execute_generic_rq", SalesforceInput, salesforce_api_wrapper.execute_generic_rq),
+        }
+        actual = {(tool["name"], tool["args_schema"], tool["ref"]) for tool in tools}
+        assert len(tools) == 6
+        assert actual == expected
+        assert all(tool["description"] for tool in tools)
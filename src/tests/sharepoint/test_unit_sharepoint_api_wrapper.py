@@ -1,41 +1,129 @@
+import copy
+import sys
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock, patch
 from langchain_core.tools import ToolException
 
-from alita_tools.sharepoint.api_wrapper import SharepointApiWrapper
+from alita_tools.sharepoint.api_wrapper import GetFiles, ReadDocument, ReadList, SharepointApiWrapper
+
+from ..utils import docx_bytes
+
+
+def _file_properties(index, folder_path):
+    """Read-only SharePoint file properties as returned by the office365 client."""
+    return MappingProxyType({
+        'Name': f'File{index}.txt',
+        'ServerRelativeUrl': f'/sites/test/{folder_path}/File{index}.txt',
+        'TimeCreated': f'2023-01-0{index + 1}T10:00:00Z',
+        'TimeLastModified': f'2023-01-0{index + 1}T11:00:00Z',
+        'LinkingUrl': f'https://example.sharepoint.com/sites/test/{folder_path}/File{index}.txt'
+    })
+
+
+# File properties and the matching get_files_list output, built once at import
+_FILE_PROPERTIES = {
+    folder_path: tuple(_file_properties(i, folder_path) for i in range(5))
+    for folder_path in ("Shared Documents", "Shared Documents/SubFolder")
+}
+_EXPECTED_FILES = {
+    folder_path: tuple(
+        {
+            'Name': props['Name'],
+            'Path': props['ServerRelativeUrl'],
+            'Created': props['TimeCreated'],
+            'Modified': props['TimeLastModified'],
+            'Link': props['LinkingUrl']
+        }
+        for props in properties
+    )
+    for folder_path, properties in _FILE_PROPERTIES.items()
+}
+
+
+def _make_mock_files(folder_path, n):
+    """Build n files as returned by get_files(); get_files_list only reads their properties."""
+    return [SimpleNamespace(properties=properties) for properties in _FILE_PROPERTIES[folder_path][:n]]
+
+
+def _assert_tool_exc(result, snippet):
+    """Check that a wrapper method returned (not raised) a ToolException mentioning snippet."""
+    assert type(result) is ToolException, result
+    assert snippet in result.args[0]
+
+
+def _stub_get_file(mock_client, mock_file=None, side_effect=None):
+    """Wire the client calls read_file makes to return mock_file, or to raise side_effect."""
+    get_file = mock_client.web.get_file_by_server_relative_path
+    if side_effect is not None:
+        get_file.side_effect = side_effect
+    else:
+        get_file.return_value = mock_file
+    mock_client.load = MagicMock(return_value=mock_client)
+    mock_client.execute_query = MagicMock()
+    return get_file
 
 
 @pytest.mark.unit
 @pytest.mark.sharepoint
 class TestSharepointApiWrapper:
 
-    @pytest.fixture
-    def mock_client_context(self):
-        with patch('alita_tools.sharepoint.api_wrapper.ClientContext') as mock_client:
-            mock_instance = MagicMock()
-            mock_client.return_value = mock_instance
-            mock_instance.with_credentials.return_value = mock_instance
-            mock_instance.with_access_token.return_value = mock_instance
-            # Patch the model_validator to avoid actual validation
-            with patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.validate_toolkit'):
-                yield mock_client
+    @pytest.fixture(scope="class", autouse=True)
+    def patched_office365(self, request):
+        # Patch the office365 classes once for the whole class; validate_toolkit
+        # imports ClientContext locally, so patch it at its source module
+        context_patcher = patch('office365.sharepoint.client_context.ClientContext')
+        credential_patcher = patch('alita_tools.sharepoint.api_wrapper.ClientCredential')
+        mocks = context_patcher.start(), credential_patcher.start()
+        request.addfinalizer(context_patcher.stop)
+        request.addfinalizer(credential_patcher.stop)
+        return mocks
 
     @pytest.fixture
-    def sharepoint_api_wrapper(self, mock_client_context):
-        # Create a wrapper with mocked _client
-        wrapper = SharepointApiWrapper(
+    def mock_client_context(self, patched_office365):
+        mock_client, _ = patched_office365
+        mock_client.reset_mock()
+        mock_instance = mock_client.return_value
+        mock_instance.with_credentials.return_value = mock_instance
+        mock_instance.with_access_token.return_value = mock_instance
+        return mock_client
+
+    @pytest.fixture(scope="class")
+    def sharepoint_api_wrapper_template(self, patched_office365):
+        # Build the wrapper once per class; tests receive shallow copies of it
+        return SharepointApiWrapper(
             site_url="https://example.sharepoint.com/sites/test",
             client_id="test_client_id",
             client_secret="test_client_secret"
         )
-        # Manually set the _client attribute since it's not being set in the constructor due to mocking
-        wrapper._client = mock_client_context.return_value
-        
-        # Create a mock web property
-        mock_web = MagicMock()
-        # Mock the web property access without trying to set it directly
-        type(wrapper._client).web = PropertyMock(return_value=mock_web)
-        
+
+    @pytest.fixture
+    def sharepoint_api_wrapper(self, sharepoint_api_wrapper_template, monkeypatch):
+        # Copy the template so per-test changes to private attributes do not leak
+        wrapper = copy.copy(sharepoint_api_wrapper_template)
+        # validate_toolkit stores the client on the class, which shadows the instance
+        # attribute on reads, so install a fresh client there for each test
+        mock_client = MagicMock()
+        # Plain attribute: read-only access to web needs no PropertyMock descriptor
+        mock_client.web = MagicMock()
+        monkeypatch.setattr(SharepointApiWrapper, "_client", mock_client)
+        wrapper._client = mock_client
+        return wrapper
+
+    @pytest.fixture
+    def mock_parse_file_content(self, monkeypatch):
+        mock_parse = MagicMock()
+        monkeypatch.setattr('alita_tools.sharepoint.api_wrapper.parse_file_content', mock_parse)
+        return mock_parse
+
+    @pytest.fixture
+    def unauthed_wrapper(self, monkeypatch):
+        # model_construct skips validation, so no client is ever created. validate_toolkit
+        # stores the client on the class, so clear any left behind by earlier tests too
+        monkeypatch.setattr(SharepointApiWrapper, "_client", None, raising=False)
+        wrapper = SharepointApiWrapper.model_construct(site_url="https://example.sharepoint.com/sites/test")
+        wrapper._client = None
         return wrapper
 
     @pytest.mark.positive
@@ -49,6 +137,8 @@ class TestSharepointApiWrapper:
         assert wrapper.site_url == "https://example.sharepoint.com/sites/test"
         assert wrapper.client_id == "test_client_id"
         assert wrapper.client_secret.get_secret_value() == "test_client_secret"
+        mock_client_context.assert_called_once_with("https://example.sharepoint.com/sites/test")
+        mock_client_context.return_value.with_credentials.assert_called_once()
 
     @pytest.mark.positive
     def test_init_with_token(self, mock_client_context):
@@ -59,8 +149,23 @@ class TestSharepointApiWrapper:
         )
         assert wrapper.site_url == "https://example.sharepoint.com/sites/test"
         assert wrapper.token.get_secret_value() == "test_token"
+        mock_client_context.assert_called_once_with("https://example.sharepoint.com/sites/test")
+        mock_client_context.return_value.with_access_token.assert_called_once()
 
-    @pytest.mark.skip(reason="Cannot directly test validation logic without modifying the main code")
+    @pytest.mark.negative
+    def test_init_import_error(self, monkeypatch):
+        """Test initialization when the office365 package is not installed."""
+        # A None entry makes the import inside validate_toolkit fail; monkeypatch restores it
+        monkeypatch.setitem(sys.modules, 'office365.sharepoint.client_context', None)
+
+        with pytest.raises(ImportError, match="office365"):
+            SharepointApiWrapper(
+                site_url="https://example.sharepoint.com/sites/test",
+                client_id="test_client_id",
+                client_secret="test_client_secret"
+            )
+
+    @pytest.mark.xfail(run=False, reason="validate_toolkit logs the missing-credentials ToolException instead of raising it")
     @pytest.mark.negative
     def test_init_without_credentials(self):
         """Test initialization without credentials raises exception."""
@@ -70,317 +175,169 @@ class TestSharepointApiWrapper:
                 SharepointApiWrapper(site_url="https://example.sharepoint.com/sites/test")
 
     @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_list')
-    def test_read_list(self, mock_read_list, sharepoint_api_wrapper):
+    def test_read_list(self, sharepoint_api_wrapper):
         """Test read_list method."""
-        # Setup the mock return value
-        mock_read_list.return_value = [
-            {"Title": "Item 1"},
-            {"Title": "Item 2"}
-        ]
+        items = [SimpleNamespace(properties={"Title": title}) for title in ("Item 1", "Item 2")]
+        mock_client = sharepoint_api_wrapper._client
+        mock_list = mock_client.web.lists.get_by_title.return_value
+        mock_list.items.configure_mock(**{
+            "get.return_value.top.return_value.execute_query.return_value": items
+        })
 
-        result = mock_read_list("Test List")
+        result = sharepoint_api_wrapper.read_list("Test List", limit=2)
 
-        assert len(result) == 2
-        assert result[0]["Title"] == "Item 1"
-        assert result[1]["Title"] == "Item 2"
-        mock_read_list.assert_called_once_with("Test List")
+        assert result == [{"Title": "Item 1"}, {"Title": "Item 2"}]
+        mock_client.web.lists.get_by_title.assert_called_once_with("Test List")
+        mock_client.load.assert_called_once_with(mock_list)
+        mock_list.items.get.return_value.top.assert_called_once_with(2)
 
     @pytest.mark.negative
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_list')
-    def test_read_list_exception(self, mock_read_list, sharepoint_api_wrapper):
-        """Test read_list method with exception."""
-        # Setup the mock to return a ToolException
-        mock_read_list.return_value = ToolException("Can not list items. Please, double check List name and read permissions.")
-
-        result = mock_read_list("Test List")
+    def test_read_list_exception(self, sharepoint_api_wrapper):
+        """Test read_list method when the list lookup fails."""
+        get_by_title = sharepoint_api_wrapper._client.web.lists.get_by_title
+        get_by_title.side_effect = Exception("List does not exist")
 
-        assert isinstance(result, ToolException)
-        assert "Can not list items" in str(result)
-        mock_read_list.assert_called_once_with("Test List")
+        result = sharepoint_api_wrapper.read_list("Missing List")
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.get_files_list')
-    def test_get_files_list(self, mock_get_files, sharepoint_api_wrapper):
-        """Test get_files_list method."""
-        # Setup the mock return value
-        mock_get_files.return_value = [
-            {
-                'Name': 'file1.docx',
-                'Path': '/sites/test/Shared Documents/file1.docx',
-                'Created': '2023-01-01',
-                'Modified': '2023-01-02',
-                'Link': 'https://example.sharepoint.com/sites/test/file1.docx'
-            },
-            {
-                'Name': 'file2.pdf',
-                'Path': '/sites/test/Shared Documents/file2.pdf',
-                'Created': '2023-01-03',
-                'Modified': '2023-01-04',
-                'Link': 'https://example.sharepoint.com/sites/test/file2.pdf'
-            }
-        ]
+        _assert_tool_exc(result, "Can not list items")
+        get_by_title.assert_called_once_with("Missing List")
 
-        result = mock_get_files()
+    @pytest.mark.negative
+    def test_read_list_client_not_initialized(self, unauthed_wrapper):
+        """Test read_list method when the client was never initialized."""
+        result = unauthed_wrapper.read_list("Test List")
 
-        assert len(result) == 2
-        assert result[0]['Name'] == 'file1.docx'
-        assert result[1]['Name'] == 'file2.pdf'
-        mock_get_files.assert_called_once_with()
+        _assert_tool_exc(result, "Can not list items")
 
     @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.get_files_list')
-    def test_get_files_list_with_folder(self, mock_get_files, sharepoint_api_wrapper):
-        """Test get_files_list method with folder name."""
-        # Setup the mock return value
-        mock_get_files.return_value = [
-            {
-                'Name': 'file1.docx',
-                'Path': '/sites/test/Shared Documents/folder1/file1.docx',
-                'Created': '2023-01-01',
-                'Modified': '2023-01-02',
-                'Link': 'https://example.sharepoint.com/sites/test/folder1/file1.docx'
-            }
-        ]
+    @pytest.mark.parametrize("folder_name, n_files, limit_files, expected_path, expected_count", [
+        ("SubFolder", 2, 5, "Shared Documents/SubFolder", 2),
+        (None, 1, 100, "Shared Documents", 1),
+        (None, 5, 3, "Shared Documents", 3),
+    ], ids=["subfolder", "root_folder", "limit"])
+    def test_get_files_list(self, sharepoint_api_wrapper, folder_name, n_files, limit_files, expected_path, expected_count):
+        """Test get_files_list method for different folders and limits."""
+        mock_files = _make_mock_files(expected_path, n_files)
+        mock_web = sharepoint_api_wrapper._client.web
+        mock_web.configure_mock(**{
+            "get_folder_by_server_relative_path.return_value.get_files.return_value.execute_query.return_value": mock_files
+        })
 
-        result = mock_get_files("folder1")
+        result = sharepoint_api_wrapper.get_files_list(folder_name, limit_files)
 
-        assert len(result) == 1
-        assert result[0]['Name'] == 'file1.docx'
-        mock_get_files.assert_called_once_with("folder1")
+        assert result == list(_EXPECTED_FILES[expected_path][:expected_count])
+        mock_web.get_folder_by_server_relative_path.assert_called_once_with(expected_path)
 
     @pytest.mark.negative
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.get_files_list')
-    def test_get_files_list_exception(self, mock_get_files, sharepoint_api_wrapper):
-        """Test get_files_list method with exception."""
-        # Setup the mock to return a ToolException
-        mock_get_files.return_value = ToolException("Can not get files. Please, double check folder name and read permissions.")
+    def test_get_files_list_empty_folder(self, sharepoint_api_wrapper):
+        """Test get_files_list method with a folder that has no files."""
+        mock_web = sharepoint_api_wrapper._client.web
+        mock_web.configure_mock(**{
+            "get_folder_by_server_relative_path.return_value.get_files.return_value.execute_query.return_value": []
+        })
 
-        result = mock_get_files()
+        result = sharepoint_api_wrapper.get_files_list("EmptyFolder")
 
-        assert isinstance(result, ToolException)
-        assert "Can not get files" in str(result)
-        mock_get_files.assert_called_once_with()
+        _assert_tool_exc(result, "folder is empty")
+        mock_web.get_folder_by_server_relative_path.assert_called_once_with("Shared Documents/EmptyFolder")
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_file')
-    def test_read_file_docx(self, mock_read_file, sharepoint_api_wrapper):
-        """Test read_file method with docx file."""
-        # Setup the mock return value
-        mock_read_file.return_value = "Parsed DOCX content"
-
-        result = mock_read_file("/sites/test/Shared Documents/test.docx")
+    @pytest.mark.negative
+    def test_get_files_list_client_not_initialized(self, unauthed_wrapper):
+        """Test get_files_list method when the client was never initialized."""
+        result = unauthed_wrapper.get_files_list()
 
-        assert result == "Parsed DOCX content"
-        mock_read_file.assert_called_once_with("/sites/test/Shared Documents/test.docx")
+        _assert_tool_exc(result, "Can not get files")
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_file')
-    def test_read_file_txt(self, mock_read_file, sharepoint_api_wrapper):
-        """Test read_file method with txt file."""
-        # Setup the mock return value
-        mock_read_file.return_value = "Text file content"
+    @pytest.mark.negative
+    def test_get_files_list_exception(self, sharepoint_api_wrapper):
+        """Test get_files_list method when the folder lookup fails."""
+        get_folder = sharepoint_api_wrapper._client.web.get_folder_by_server_relative_path
+        get_folder.side_effect = Exception("Folder does not exist")
 
-        result = mock_read_file("/sites/test/Shared Documents/test.txt")
+        result = sharepoint_api_wrapper.get_files_list("Missing")
 
-        assert result == "Text file content"
-        mock_read_file.assert_called_once_with("/sites/test/Shared Documents/test.txt")
+        _assert_tool_exc(result, "Can not get files")
+        get_folder.assert_called_once_with("Shared Documents/Missing")
 
-    @pytest.mark.negative
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_file')
-    def test_read_file_not_found(self, mock_read_file, sharepoint_api_wrapper):
-        """Test read_file method when file not found."""
-        # Setup the mock to return a ToolException
-        mock_read_file.return_value = ToolException("File not found. Please, check file name and path.")
+    @pytest.mark.positive
+    def test_read_file_docx(self, sharepoint_api_wrapper):
+        """Test read_file method with docx file, parsed by the real content parser."""
+        path = "/sites/test/Shared Documents/test.docx"
+        mock_file = MagicMock()
+        mock_file.configure_mock(name="test.docx", **{"read.return_value": docx_bytes("Paragraph 1", "Paragraph 2")})
+        get_file = _stub_get_file(sharepoint_api_wrapper._client, mock_file)
 
-        result = mock_read_file("/sites/test/Shared Documents/nonexistent.txt")
+        result = sharepoint_api_wrapper.read_file(path)
 
-        assert isinstance(result, ToolException)
-        assert "File not found" in str(result)
-        mock_read_file.assert_called_once_with("/sites/test/Shared Documents/nonexistent.txt")
+        assert result == "Paragraph 1\nParagraph 2"
+        get_file.assert_called_once_with(path)
 
     @pytest.mark.negative
-    @patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper.read_file')
-    def test_read_file_unsupported_type(self, mock_read_file, sharepoint_api_wrapper):
-        """Test read_file method with unsupported file type."""
-        # Setup the mock to return a ToolException
-        mock_read_file.return_value = ToolException("Not supported type of files entered. Supported types are TXT and DOCX only.")
+    def test_read_file_not_found(self, sharepoint_api_wrapper, mock_parse_file_content):
+        """Test read_file method when file not found."""
+        path = "/sites/test/Shared Documents/nonexistent.txt"
+        get_file = _stub_get_file(sharepoint_api_wrapper._client, side_effect=Exception("404 Not Found"))
+
+        result = sharepoint_api_wrapper.read_file(path)
+
+        _assert_tool_exc(result, "File not found")
+        get_file.assert_called_once_with(path)
+        mock_parse_file_content.assert_not_called()
+
+    @pytest.mark.parametrize("file_name, content, expected_type, expected_text", [
+        pytest.param("test.txt", b"Hello, World!", str, "Hello, World!",
+                     id="txt", marks=pytest.mark.positive),
+        pytest.param("image.jpg", b"jpeg_data", ToolException, "Not supported type",
+                     id="unsupported", marks=pytest.mark.negative),
+        pytest.param("bad_encoding.txt", b"\x80abc", ToolException, "Error decoding file content",
+                     id="decode_error", marks=pytest.mark.negative),
+    ])
+    def test_read_file(self, sharepoint_api_wrapper, file_name, content, expected_type, expected_text):
+        """Test read_file method end to end through the real content parser."""
+        path = f"/sites/test/Shared Documents/{file_name}"
+        mock_file = MagicMock()
+        mock_file.configure_mock(name=file_name, **{"read.return_value": content})
+        get_file = _stub_get_file(sharepoint_api_wrapper._client, mock_file)
 
-        result = mock_read_file("/sites/test/Shared Documents/test.xyz")
+        result = sharepoint_api_wrapper.read_file(path)
 
-        assert isinstance(result, ToolException)
-        assert "Not supported type" in str(result)
-        mock_read_file.assert_called_once_with("/sites/test/Shared Documents/test.xyz")
+        if expected_type is ToolException:
+            _assert_tool_exc(result, expected_text)
+        else:
+            assert result == expected_text
+        get_file.assert_called_once_with(path)
 
     @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.parse_file_content')
-    def test_read_file_pdf_single_page(self, mock_parse_file_content, sharepoint_api_wrapper):
-        """Test read_file method with PDF file and specific page."""
-        # Setup mocks
+    @pytest.mark.parametrize("file_name, content, page_number, parsed", [
+        ("test.pdf", b"pdf content", 2, "PDF page content"),
+        ("test.pdf", b"pdf content", None, "Page 1 contentPage 2 contentPage 3 content"),
+        ("test.pptx", b"pptx content", 2, "Slide 2 content"),
+        ("test.pptx", b"pptx content", None, "Slide 1 contentSlide 2 contentSlide 3 content"),
+    ], ids=["pdf_single_page", "pdf_all_pages", "pptx_single_slide", "pptx_all_slides"])
+    def test_read_file_paged(self, sharepoint_api_wrapper, mock_parse_file_content,
+                             file_name, content, page_number, parsed):
+        """Test read_file method with PDF/PPTX files, for a single page and for the whole document."""
         mock_file = MagicMock()
-        mock_file.name = "test.pdf"
-        mock_file.read = MagicMock(return_value=b"pdf content")
-        
-        # Get the mocked web property and configure it
-        mock_web = sharepoint_api_wrapper._client.web
-        mock_web.get_file_by_server_relative_path.return_value = mock_file
-        
-        # Mock load and execute_query methods
-        sharepoint_api_wrapper._client.load = MagicMock(return_value=sharepoint_api_wrapper._client)
-        sharepoint_api_wrapper._client.execute_query = MagicMock()
-        
-        # Mock parse_file_content to return expected result
-        mock_parse_file_content.return_value = "PDF page content"
-        
-        # Call the method with a specific page
-        result = sharepoint_api_wrapper.read_file("/sites/test/Shared Documents/test.pdf", page_number=2)
-        
-        # Assertions
-        assert result == "PDF page content"
-        mock_parse_file_content.assert_called_once_with(mock_file.name, mock_file.read.return_value, False, 2)
+        # name is reserved by the MagicMock constructor, so set it through configure_mock
+        mock_file.configure_mock(name=file_name, **{"read.return_value": content})
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.parse_file_content')
-    def test_read_file_pdf_all_pages(self, mock_parse_file_content, sharepoint_api_wrapper):
-        """Test read_file method with PDF file and all pages."""
-        # Setup mocks
-        mock_file = MagicMock()
-        mock_file.name = "test.pdf"
-        mock_file.read = MagicMock(return_value=b"pdf content")
-        
-        # Get the mocked web property and configure it
-        mock_web = sharepoint_api_wrapper._client.web
-        mock_web.get_file_by_server_relative_path.return_value = mock_file
-        
-        # Mock load and execute_query methods
-        sharepoint_api_wrapper._client.load = MagicMock(return_value=sharepoint_api_wrapper._client)
-        sharepoint_api_wrapper._client.execute_query = MagicMock()
-        
-        # Mock parse_file_content to return expected result
-        mock_parse_file_content.return_value = "Page 1 contentPage 2 contentPage 3 content"
-        
-        # Call the method without specifying a page
-        result = sharepoint_api_wrapper.read_file("/sites/test/Shared Documents/test.pdf")
-        
-        # Assertions
-        assert result == "Page 1 contentPage 2 contentPage 3 content"
-        mock_parse_file_content.assert_called_once_with(mock_file.name, mock_file.read.return_value, False, None)
+        _stub_get_file(sharepoint_api_wrapper._client, mock_file)
+        mock_parse_file_content.return_value = parsed
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.parse_file_content')
-    def test_read_file_pptx_single_slide(self, mock_parse_file_content, sharepoint_api_wrapper):
-        """Test read_file method with PPTX file and specific slide."""
-        # Setup mocks
-        mock_file = MagicMock()
-        mock_file.name = "test.pptx"
-        mock_file.read = MagicMock(return_value=b"pptx content")
-        
-        # Get the mocked web property and configure it
-        mock_web = sharepoint_api_wrapper._client.web
-        mock_web.get_file_by_server_relative_path.return_value = mock_file
-        
-        # Mock load and execute_query methods
-        sharepoint_api_wrapper._client.load = MagicMock(return_value=sharepoint_api_wrapper._client)
-        sharepoint_api_wrapper._client.execute_query = MagicMock()
-        
-        # Mock parse_file_content to return expected result
-        mock_parse_file_content.return_value = "Slide 2 content"
-        
-        # Call the method with a specific slide
-        result = sharepoint_api_wrapper.read_file("/sites/test/Shared Documents/test.pptx", page_number=2)
-        
-        # Assertions
-        assert result == "Slide 2 content"
-        mock_parse_file_content.assert_called_once_with(mock_file.name, mock_file.read.return_value, False, 2)
+        result = sharepoint_api_wrapper.read_file(f"/sites/test/Shared Documents/{file_name}", page_number=page_number)
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.api_wrapper.parse_file_content')
-    def test_read_file_pptx_all_slides(self, mock_parse_file_content, sharepoint_api_wrapper):
-        """Test read_file method with PPTX file and all slides."""
-        # Setup mocks
-        mock_file = MagicMock()
-        mock_file.name = "test.pptx"
-        mock_file.read = MagicMock(return_value=b"pptx content")
-        
-        # Get the mocked web property and configure it
-        mock_web = sharepoint_api_wrapper._client.web
-        mock_web.get_file_by_server_relative_path.return_value = mock_file
-        
-        # Mock load and execute_query methods
-        sharepoint_api_wrapper._client.load = MagicMock(return_value=sharepoint_api_wrapper._client)
-        sharepoint_api_wrapper._client.execute_query = MagicMock()
-        
-        # Mock parse_file_content to return expected result
-        mock_parse_file_content.return_value = "Slide 1 contentSlide 2 contentSlide 3 content"
-        
-        # Call the method without specifying a slide
-        result = sharepoint_api_wrapper.read_file("/sites/test/Shared Documents/test.pptx")
-        
-        # Assertions
-        assert result == "Slide 1 contentSlide 2 contentSlide 3 content"
-        mock_parse_file_content.assert_called_once_with(mock_file.name, mock_file.read.return_value, False, None)
+        assert result == parsed
+        mock_parse_file_content.assert_called_once_with(file_name, content, False, page_number)
 
     @pytest.mark.positive
     def test_get_available_tools(self, sharepoint_api_wrapper):
         """Test get_available_tools method."""
         tools = sharepoint_api_wrapper.get_available_tools()
 
-        assert len(tools) == 3
-        tool_names = [tool["name"] for tool in tools]
-        assert "read_list" in tool_names
-        assert "get_files_list" in tool_names
-        assert "read_document" in tool_names
-
-        # Verify the structure of each tool
-        for tool in tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "args_schema" in tool
-            assert "ref" in tool
-
-        # Verify the args_schema classes
-        assert tools[0]["args_schema"].__name__ == "ReadList"
-        assert tools[1]["args_schema"].__name__ == "GetFiles"
-        assert tools[2]["args_schema"].__name__ == "ReadDocument"
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_read_pdf_page(self, sharepoint_api_wrapper):
-        """Test that PDF parsing is handled by the content parser."""
-        # This test requires more complex mocking of the content parser module
-        pass
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_read_pdf_page_with_images(self, sharepoint_api_wrapper):
-        """Test PDF parsing with image capture."""
-        # This test requires more complex mocking of the content parser module
-        pass
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_read_pptx_slide(self, sharepoint_api_wrapper):
-        """Test that PPTX parsing is handled by the content parser."""
-        # This test requires more complex mocking of the content parser module
-        pass
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_read_pptx_slide_with_images(self, sharepoint_api_wrapper):
-        """Test PPTX parsing with image capture."""
-        # This test requires more complex mocking of the content parser module
-        pass
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_read_pptx_slide_with_image_error(self, sharepoint_api_wrapper):
-        """Test PPTX parsing with image processing error."""
-        # This test requires more complex mocking of the content parser module
-        pass
-
-    @pytest.mark.skip(reason="Content parser integration test requires more complex mocking")
-    @pytest.mark.positive
-    def test_describe_image(self, sharepoint_api_wrapper):
-        """Test that describe_image is properly used in content parsing."""
-        # This test requires more complex mocking of the content parser module
-        pass
+        expected = [
+            ("read_list", ReadList, sharepoint_api_wrapper.read_list),
+            ("get_files_list", GetFiles, sharepoint_api_wrapper.get_files_list),
+            ("read_document", ReadDocument, sharepoint_api_wrapper.read_file),
+        ]
+        assert [(tool["name"], tool["args_schema"], tool["ref"]) for tool in tools] == expected
+        assert all(tool.get("description") for tool in tools)
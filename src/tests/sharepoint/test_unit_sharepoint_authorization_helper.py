@@ -1,17 +1,46 @@
+import copy
+import io
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import jwt
-from datetime import datetime, timezone, timedelta
 
 from alita_tools.sharepoint.authorization_helper import SharepointAuthorizationHelper
+from ..utils import FakeResponse
+
+# exp claims far from "now" in either direction, so results do not depend on the clock
+_FUTURE_EXP = 9_999_999_999
+_PAST_EXP = 1
 
 
 @pytest.mark.unit
 @pytest.mark.sharepoint
 class TestSharepointAuthorizationHelper:
 
+    @pytest.fixture(scope="class", autouse=True)
+    def patched_requests_and_jwt(self, request):
+        # Patch the HTTP and JWT entry points once for the whole class; per-test fixtures reset them
+        post_patcher = patch('alita_tools.sharepoint.authorization_helper.requests.post')
+        decode_patcher = patch('alita_tools.sharepoint.authorization_helper.jwt.decode')
+        mocks = post_patcher.start(), decode_patcher.start()
+        request.addfinalizer(post_patcher.stop)
+        request.addfinalizer(decode_patcher.stop)
+        return mocks
+
+    @pytest.fixture
+    def mock_post(self, patched_requests_and_jwt):
+        mock_post, _ = patched_requests_and_jwt
+        mock_post.reset_mock(return_value=True, side_effect=True)
+        return mock_post
+
     @pytest.fixture
-    def auth_helper(self):
+    def mock_decode(self, patched_requests_and_jwt):
+        _, mock_decode = patched_requests_and_jwt
+        mock_decode.reset_mock(return_value=True, side_effect=True)
+        return mock_decode
+
+    @pytest.fixture(scope="class")
+    def auth_helper_template(self):
         return SharepointAuthorizationHelper(
             tenant="test-tenant.com",
             client_id="test-client-id",
@@ -20,6 +49,11 @@ class TestSharepointAuthorizationHelper:
             token_json="test-token"
         )
 
+    @pytest.fixture
+    def auth_helper(self, auth_helper_template):
+        # Tests only rebind attributes such as token_json, so a shallow copy keeps them isolated
+        return copy.copy(auth_helper_template)
+
     @pytest.mark.positive
     def test_init(self, auth_helper):
         """Test initialization of SharepointAuthorizationHelper."""
@@ -33,13 +67,9 @@ class TestSharepointAuthorizationHelper:
         assert auth_helper.access_token is None
 
     @pytest.mark.positive
-    @patch('alita_tools.sharepoint.authorization_helper.requests.post')
     def test_refresh_access_token_success(self, mock_post, auth_helper):
         """Test successful token refresh."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"access_token": "new-access-token"}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(200, {"access_token": "new-access-token"})
 
         result = auth_helper.refresh_access_token()
 
@@ -57,93 +87,61 @@ class TestSharepointAuthorizationHelper:
         )
 
     @pytest.mark.negative
-    @patch('alita_tools.sharepoint.authorization_helper.requests.post')
-    def test_refresh_access_token_failure(self, mock_post, auth_helper):
+    def test_refresh_access_token_failure(self, mock_post, auth_helper, monkeypatch):
         """Test failed token refresh."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Error refreshing token"
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(400, text="Error refreshing token")
+        stdout = io.StringIO()
+        monkeypatch.setattr("sys.stdout", stdout)
 
         result = auth_helper.refresh_access_token()
 
         assert result is None
+        assert stdout.getvalue() == "Error: 400\nError refreshing token\n"
         mock_post.assert_called_once()
 
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.authorization_helper.SharepointAuthorizationHelper.is_token_valid')
-    @patch('alita_tools.sharepoint.authorization_helper.SharepointAuthorizationHelper.refresh_access_token')
-    def test_get_access_token_valid(self, mock_refresh, mock_is_valid, auth_helper):
-        """Test get_access_token with valid token."""
-        # Setup token_json as a dictionary with access_token
-        auth_helper.token_json = {'access_token': 'valid-token'}
-        mock_is_valid.return_value = True
-
-        result = auth_helper.get_access_token()
-
-        assert result == 'valid-token'
-        mock_is_valid.assert_called_once_with({'access_token': 'valid-token'})
-        mock_refresh.assert_not_called()
-
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.authorization_helper.SharepointAuthorizationHelper.is_token_valid')
-    @patch('alita_tools.sharepoint.authorization_helper.SharepointAuthorizationHelper.refresh_access_token')
-    def test_get_access_token_invalid(self, mock_refresh, mock_is_valid, auth_helper):
-        """Test get_access_token with invalid token."""
-        auth_helper.token_json = {'access_token': 'invalid-token'}
-        mock_is_valid.return_value = False
-        mock_refresh.return_value = 'new-token'
-
-        result = auth_helper.get_access_token()
-
-        assert result == 'new-token'
-        mock_is_valid.assert_called_once_with({'access_token': 'invalid-token'})
-        mock_refresh.assert_called_once()
-
-    @pytest.mark.positive
-    @patch('alita_tools.sharepoint.authorization_helper.jwt.decode')
-    def test_is_token_valid_true(self, mock_decode, auth_helper):
-        """Test is_token_valid with valid token."""
-        # Create a future expiration time
-        future_time = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
-        mock_decode.return_value = {"exp": future_time}
-
-        result = auth_helper.is_token_valid("valid-token")
-
-        assert result is True
-        mock_decode.assert_called_once_with("valid-token", options={"verify_signature": False})
-
-    @pytest.mark.negative
-    @patch('alita_tools.sharepoint.authorization_helper.jwt.decode')
-    def test_is_token_valid_expired(self, mock_decode, auth_helper):
-        """Test is_token_valid with expired token."""
-        # Create a past expiration time
-        past_time = int((datetime.now(timezone.utc) - timedelta(hours=1)).timestamp())
-        mock_decode.return_value = {"exp": past_time}
-
-        result = auth_helper.is_token_valid("expired-token")
-
-        assert result is False
-        mock_decode.assert_called_once_with("expired-token", options={"verify_signature": False})
-
-    @pytest.mark.negative
-    @patch('alita_tools.sharepoint.authorization_helper.jwt.decode')
-    def test_is_token_valid_no_exp(self, mock_decode, auth_helper):
-        """Test is_token_valid with token missing exp claim."""
-        mock_decode.return_value = {}  # No exp claim
-
-        result = auth_helper.is_token_valid("invalid-token")
-
-        assert result is False
-        mock_decode.assert_called_once_with("invalid-token", options={"verify_signature": False})
-
-    @pytest.mark.negative
-    @patch('alita_tools.sharepoint.authorization_helper.jwt.decode')
-    def test_is_token_valid_jwt_error(self, mock_decode, auth_helper):
-        """Test is_token_valid with JWT decode error."""
-        mock_decode.side_effect = jwt.InvalidTokenError("Invalid token")
-
-        result = auth_helper.is_token_valid("bad-token")
-
-        assert result is False
-        mock_decode.assert_called_once_with("bad-token", options={"verify_signature": False})
+    @pytest.mark.parametrize("access_token, is_valid, refresh_result, expected", [
+        pytest.param("valid-token", True, None, "valid-token",
+                     id="valid", marks=pytest.mark.positive),
+        pytest.param("invalid-token", False, "new-token", "new-token",
+                     id="refreshed", marks=pytest.mark.positive),
+        pytest.param("invalid-token", False, None, None,
+                     id="refresh_failed", marks=pytest.mark.negative),
+    ])
+    def test_get_access_token(self, auth_helper, access_token, is_valid, refresh_result, expected):
+        """Test get_access_token returns the stored token while valid and refreshes it otherwise."""
+        auth_helper.token_json = {'access_token': access_token}
+
+        with patch.object(SharepointAuthorizationHelper, 'is_token_valid', return_value=is_valid) as mock_is_valid, \
+                patch.object(SharepointAuthorizationHelper, 'refresh_access_token',
+                             return_value=refresh_result) as mock_refresh:
+            result = auth_helper.get_access_token()
+
+        assert result == expected
+        mock_is_valid.assert_called_once_with({'access_token': access_token})
+        assert mock_refresh.call_count == (0 if is_valid else 1)
+
+    @pytest.mark.parametrize("token, exp, decode_error, expected", [
+        pytest.param("valid-token", _FUTURE_EXP, None, True,
+                     id="valid", marks=pytest.mark.positive),
+        pytest.param("expired-token", _PAST_EXP, None, False,
+                     id="expired", marks=pytest.mark.negative),
+        pytest.param("invalid-token", None, None, False,
+                     id="no_exp", marks=pytest.mark.negative),
+        pytest.param("expired-token", None, jwt.ExpiredSignatureError("Signature has expired"), False,
+                     id="expired_signature_error", marks=pytest.mark.negative),
+        pytest.param("bad-token", None, jwt.InvalidTokenError("Invalid token"), False,
+                     id="jwt_error", marks=pytest.mark.negative),
+    ])
+    def test_is_token_valid(self, mock_decode, auth_helper, token, exp, decode_error, expected):
+        """Test is_token_valid for valid, expired, exp-less and undecodable tokens."""
+        if decode_error is not None:
+            mock_decode.side_effect = decode_error
+        elif exp is not None:
+            mock_decode.return_value = {"exp": exp}
+        else:
+            mock_decode.return_value = {}  # No exp claim
+
+        result = auth_helper.is_token_valid(token)
+
+        assert result is expected
+        mock_decode.assert_called_once_with(token, options={"verify_signature": False})
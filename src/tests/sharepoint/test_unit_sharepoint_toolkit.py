@@ -1,8 +1,9 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from langchain_core.tools import BaseTool
 
 from alita_tools.sharepoint import SharepointToolkit, get_tools
+from alita_tools.sharepoint.api_wrapper import SharepointApiWrapper
 
 
 @pytest.mark.unit
@@ -10,31 +11,17 @@ from alita_tools.sharepoint import SharepointToolkit, get_tools
 class TestSharepointToolkit:
 
     @pytest.fixture
-    def mock_sharepoint_api_wrapper(self):
-        with patch('alita_tools.sharepoint.api_wrapper.SharepointApiWrapper') as mock_wrapper:
-            mock_instance = MagicMock()
-            mock_wrapper.return_value = mock_instance
-            mock_instance.get_available_tools.return_value = [
-                {
-                    "name": "read_list",
-                    "description": "Test description for read_list",
-                    "args_schema": MagicMock(),
-                    "ref": MagicMock()
-                },
-                {
-                    "name": "get_files_list",
-                    "description": "Test description for get_files_list",
-                    "args_schema": MagicMock(),
-                    "ref": MagicMock()
-                },
-                {
-                    "name": "read_document",
-                    "description": "Test description for read_document",
-                    "args_schema": MagicMock(),
-                    "ref": MagicMock()
-                }
-            ]
-            yield mock_wrapper
+    def mock_sharepoint_api_wrapper(self, monkeypatch):
+        # BaseAction needs a pydantic api_wrapper and real args schemas, so the mocked class
+        # hands out an unvalidated wrapper; get_toolkit binds the name in alita_tools.sharepoint
+        mock_wrapper = MagicMock(return_value=SharepointApiWrapper.model_construct(
+            site_url="https://example.sharepoint.com/sites/test"
+        ))
+        monkeypatch.setattr('alita_tools.sharepoint.SharepointApiWrapper', mock_wrapper)
+        # get_toolkit reads toolkit_max_length, which only toolkit_config_schema sets; do not
+        # depend on that test having run first in the same process (e.g. under pytest-xdist)
+        monkeypatch.setattr(SharepointToolkit, "toolkit_max_length", 0, raising=False)
+        return mock_wrapper
 
     @pytest.mark.positive
     def test_toolkit_config_schema(self):
@@ -62,6 +49,11 @@ class TestSharepointToolkit:
         
         assert len(toolkit.tools) == 3
         assert all(isinstance(tool, BaseTool) for tool in toolkit.tools)
+        mock_sharepoint_api_wrapper.assert_called_once_with(
+            site_url="https://example.sharepoint.com/sites/test",
+            client_id="test_client_id",
+            client_secret="test_client_secret"
+        )
         
         tool_names = [tool.name for tool in toolkit.tools]
         assert "read_list" in tool_names
@@ -102,11 +94,11 @@ class TestSharepointToolkit:
             assert tool.name.startswith("MySharepoint_")
 
     @pytest.mark.positive
-    @patch('alita_tools.sharepoint.SharepointToolkit.get_toolkit')
-    def test_get_tools_function(self, mock_get_toolkit, mock_sharepoint_api_wrapper):
+    def test_get_tools_function(self, mock_sharepoint_api_wrapper, monkeypatch):
         """Test the module-level get_tools function."""
-        mock_toolkit = MagicMock()
-        mock_get_toolkit.return_value = mock_toolkit
+        mock_get_toolkit = MagicMock()
+        mock_toolkit = mock_get_toolkit.return_value
+        monkeypatch.setattr(SharepointToolkit, 'get_toolkit', mock_get_toolkit)
         
         tool_config = {
             'settings': {
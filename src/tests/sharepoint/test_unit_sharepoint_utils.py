@@ -1,50 +1,53 @@
+from io import StringIO
+
 import pytest
-from docx import Document
-from io import BytesIO
 from alita_tools.sharepoint.utils import read_docx_from_bytes
 
+from ..utils import docx_bytes
+
+
 @pytest.mark.unit
 @pytest.mark.sharepoint
 @pytest.mark.utils
 class TestSharepointReadDocxFromBytes:
+    # Bytes are immutable, so build each package once per class and share it
+    @pytest.fixture(scope="class")
+    def valid_docx_bytes(self):
+        return docx_bytes("Paragraph 1", "Paragraph 2")
+
+    @pytest.fixture(scope="class")
+    def empty_docx_bytes(self):
+        return docx_bytes()
+
     @pytest.mark.positive
-    def test_read_docx_from_bytes_positive(self):
+    def test_read_docx_from_bytes_positive(self, valid_docx_bytes):
         """Test successful reading of .docx content from bytes."""
-        doc = Document()
-        doc.add_paragraph("Paragraph 1")
-        doc.add_paragraph("Paragraph 2")
-        byte_stream = BytesIO()
-        doc.save(byte_stream)
-        byte_stream.seek(0)
-        
-        result = read_docx_from_bytes(byte_stream.getvalue())
+        result = read_docx_from_bytes(valid_docx_bytes)
         
         assert result == "Paragraph 1\nParagraph 2"
 
     @pytest.mark.negative
-    def test_read_docx_from_bytes_empty_file(self):
+    def test_read_docx_from_bytes_empty_file(self, empty_docx_bytes):
         """Test behavior with an empty .docx file."""
-        doc = Document()
-        byte_stream = BytesIO()
-        doc.save(byte_stream)
-        byte_stream.seek(0)
-
-        result = read_docx_from_bytes(byte_stream.getvalue())
+        result = read_docx_from_bytes(empty_docx_bytes)
         
         assert result == ""
 
     @pytest.mark.negative
-    def test_read_docx_from_bytes_invalid_format(self):
+    def test_read_docx_from_bytes_invalid_format(self, monkeypatch):
         """Test behavior with invalid file content."""
         invalid_content = b"This is not a valid docx file."
+        stdout = StringIO()
+        monkeypatch.setattr("sys.stdout", stdout)
         
         result = read_docx_from_bytes(invalid_content)
         
         assert result == ""
+        assert stdout.getvalue().startswith("Error reading .docx from bytes:")
 
     @pytest.mark.negative
     def test_read_docx_from_bytes_none_input(self):
         """Test behavior when input is None."""
         result = read_docx_from_bytes(None)
 
-        assert result == ""
\ No newline at end of file
+        assert result == ""
@@ -1,6 +1,54 @@
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape
+
 from pydantic import BaseModel
 from pydantic_core import SchemaValidator
 
 def check_schema(model: BaseModel) -> None:
     schema_validator = SchemaValidator(schema=model.__pydantic_core_schema__)
     schema_validator.validate_python(model.__dict__)
+
+
+class FakeResponse:
+    """Lightweight stand-in for ``requests.Response`` when no call tracking is needed."""
+    __slots__ = ("status_code", "text", "_payload")
+
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self.text = text
+        self._payload = payload
+
+    def json(self):
+        if isinstance(self._payload, Exception):
+            raise self._payload
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+# Smallest OOXML package python-docx will open: content types, the package rels and the main part
+_CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>{body}</w:body></w:document>"""
+
+
+def docx_bytes(*paragraphs):
+    """Write a minimal .docx package with the given paragraphs, without python-docx's serializer."""
+    body = "".join(f"<w:p><w:r><w:t>{escape(paragraph)}</w:t></w:r></w:p>" for paragraph in paragraphs)
+    byte_stream = BytesIO()
+    with zipfile.ZipFile(byte_stream, "w") as package:
+        package.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        package.writestr("_rels/.rels", _RELS_XML)
+        package.writestr("word/document.xml", _DOCUMENT_XML.format(body=body))
+    return byte_stream.getvalue()